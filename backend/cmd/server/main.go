@@ -3,12 +3,16 @@ package main
 import (
 	"context"
 	"log"
+	"net/http"
+	"time"
 
 	"github.com/Parallels/pd-ai-agents-registry/internal/api/routes"
 	"github.com/Parallels/pd-ai-agents-registry/internal/config"
 	"github.com/Parallels/pd-ai-agents-registry/internal/database/seeder"
 	"github.com/Parallels/pd-ai-agents-registry/internal/db/mongodb"
 	"github.com/Parallels/pd-ai-agents-registry/internal/logger"
+	"github.com/gin-gonic/gin"
+	"golang.org/x/sync/errgroup"
 )
 
 // @title           Parallels AI Registry API
@@ -60,11 +64,28 @@ func main() {
 		}
 	}()
 
+	// Index creation and seeding are independent round trips to Mongo, so
+	// run them concurrently to shave startup time
 	db := mongoClient.Database()
-	seeder := seeder.NewDatabaseSeeder(db, cfg.Admin.Password)
-	if err := seeder.Seed(context.Background()); err != nil {
-		log.Fatalf("Failed to seed database: %v", err)
+	dbSeeder := seeder.NewDatabaseSeeder(db, cfg.Admin.Password)
+
+	var g errgroup.Group
+	g.Go(func() error {
+		// Make sure the metadata queries run against indexes; every package
+		// and version lookup is a point query on these keys
+		return mongoClient.EnsureIndexes(context.Background())
+	})
+	g.Go(func() error {
+		return dbSeeder.Seed(context.Background())
+	})
+	if err := g.Wait(); err != nil {
+		logger.Fatal("Failed to initialize database", err)
+	}
+	// Drop gin's debug-mode bookkeeping outside development
+	if cfg.AppEnv == "production" {
+		gin.SetMode(gin.ReleaseMode)
 	}
+
 	// Initialize router
 	router := routes.NewRouter(cfg, logger, mongoClient)
 
@@ -73,8 +94,18 @@ func main() {
 	if port == "" {
 		port = "80"
 	}
+
+	// Serve through an explicitly configured http.Server so header reads
+	// are bounded and keep-alive connections are recycled predictably
+	srv := &http.Server{
+		Addr:              ":" + port,
+		Handler:           router,
+		ReadHeaderTimeout: 10 * time.Second,
+		IdleTimeout:       120 * time.Second,
+	}
+
 	logger.Info("Starting server", "port", port)
-	if err := router.Run(":" + port); err != nil {
+	if err := srv.ListenAndServe(); err != nil {
 		logger.Fatal("Failed to start server", err)
 	}
 }
@@ -17,6 +17,7 @@ require (
 	go.mongodb.org/mongo-driver v1.16.1
 	go.uber.org/zap v1.26.0
 	golang.org/x/crypto v0.36.0
+	golang.org/x/sync v0.12.0
 	golang.org/x/time v0.5.0
 )
 
@@ -85,7 +86,6 @@ require (
 	golang.org/x/arch v0.3.0 // indirect
 	golang.org/x/exp v0.0.0-20230905200255-921286631fa9 // indirect
 	golang.org/x/net v0.38.0 // indirect
-	golang.org/x/sync v0.12.0 // indirect
 	golang.org/x/sys v0.31.0 // indirect
 	golang.org/x/text v0.23.0 // indirect
 	golang.org/x/tools v0.21.1-0.20240508182429-e35e4ccd0d2d // indirect
@@ -1,41 +1,28 @@
 package handlers
 
 import (
-	"fmt"
 	"net/http"
+	"strconv"
 	"time"
 
 	"github.com/Parallels/pd-ai-agents-registry/internal/models"
 	"github.com/gin-gonic/gin"
 )
 
-// @Summary Download package file
-// @Description Download a specific file from a package version
-// @Tags packages
-// @Accept json
-// @Produce octet-stream
-// @Param name path string true "Package name"
-// @Param version path string true "Version"
-// @Param filename path string true "Filename"
-// @Success 200 {file} binary
-// @Failure 404 {object} ErrorResponse
-// @Failure 500 {object} ErrorResponse
-// @Router /download/{name}/{version}/{filename} [get]
-func (h *Handler) DownloadPackage(c *gin.Context) {
-	name := c.Param("name")
-	version := c.Param("version")
-	filename := c.Param("filename")
-
+// lookupPackageFile resolves the package/version/filename path parameters to
+// the stored file metadata; it writes the error response and returns nil when
+// any step fails
+func (h *Handler) lookupPackageFile(c *gin.Context, name, version, filename string) *models.File {
 	// Get package
 	pkg, err := h.db.GetPackage(c.Request.Context(), name)
 	if err != nil {
 		h.logger.Error("Failed to get package", "error", err)
 		c.JSON(http.StatusInternalServerError, ErrorResponse{Error: "Failed to retrieve package"})
-		return
+		return nil
 	}
 	if pkg == nil {
 		c.JSON(http.StatusNotFound, ErrorResponse{Error: "Package not found"})
-		return
+		return nil
 	}
 
 	// Get version
@@ -43,43 +30,79 @@ func (h *Handler) DownloadPackage(c *gin.Context) {
 	if err != nil {
 		h.logger.Error("Failed to get version", "error", err)
 		c.JSON(http.StatusInternalServerError, ErrorResponse{Error: "Failed to retrieve version"})
-		return
+		return nil
 	}
 	if ver == nil {
 		c.JSON(http.StatusNotFound, ErrorResponse{Error: "Version not found"})
-		return
+		return nil
 	}
 
 	// Find file in version
-	var fileInfo *models.File
 	for _, f := range ver.Files {
 		if f.Name == filename {
-			fileInfo = &f
-			break
+			return &f
 		}
 	}
+	c.JSON(http.StatusNotFound, ErrorResponse{Error: "File not found"})
+	return nil
+}
+
+// @Summary Download package file
+// @Description Download a specific file from a package version
+// @Tags packages
+// @Accept json
+// @Produce octet-stream
+// @Param name path string true "Package name"
+// @Param version path string true "Version"
+// @Param filename path string true "Filename"
+// @Success 200 {file} binary
+// @Failure 404 {object} ErrorResponse
+// @Failure 500 {object} ErrorResponse
+// @Router /download/{name}/{version}/{filename} [get]
+func (h *Handler) DownloadPackage(c *gin.Context) {
+	name := c.Param("name")
+	version := c.Param("version")
+	filename := c.Param("filename")
+
+	fileInfo := h.lookupPackageFile(c, name, version, filename)
 	if fileInfo == nil {
-		c.JSON(http.StatusNotFound, ErrorResponse{Error: "File not found"})
 		return
 	}
 
-	// Generate S3 key
-	s3Key := fmt.Sprintf("packages/%s/%s/%s", name, version, filename)
-
-	// Check if file exists in S3
-	exists, err := h.storage.Exists(c.Request.Context(), s3Key)
-	if err != nil {
-		h.logger.Error("Failed to check file existence", "error", err)
-		c.JSON(http.StatusInternalServerError, ErrorResponse{Error: "Failed to check file existence"})
+	// Versioned artifacts are immutable, so the stored hash is a stable
+	// cache validator; clients that already hold the bytes get a 304
+	// without touching S3
+	etag := `"` + fileInfo.Hash + `"`
+	c.Header("ETag", etag)
+	if c.GetHeader("If-None-Match") == etag {
+		// Only the 304 carries the long-lived freshness; the redirect below
+		// must never be cached since its presigned URL expires in minutes
+		c.Header("Cache-Control", "public, max-age=31536000, immutable")
+		c.Status(http.StatusNotModified)
 		return
 	}
-	if !exists {
-		c.JSON(http.StatusNotFound, ErrorResponse{Error: "File not found in storage"})
-		return
+	c.Header("Cache-Control", "no-store")
+
+	// Uploads store objects content-addressed under the file hash
+	// (files.go), so presign that key — it is the one that exists. Plain
+	// concatenation avoids Sprintf's format parsing and reflection on the
+	// hottest request path
+	s3Key := "packages/" + fileInfo.Hash + "/" + filename
+
+	// The version metadata just resolved names this hash, so the
+	// content-addressed object is known to exist; no HeadObject round trip
+	// is needed before presigning
+
+	// Objects are stored with a generic content type, so have the presigned
+	// response carry the type recorded at upload (falling back to the
+	// extension lookup) and an attachment disposition
+	contentType := fileInfo.ContentType
+	if contentType == "" {
+		contentType = getContentType(filename)
 	}
 
 	// Get signed URL for download
-	signedURL, err := h.storage.GetSignedURL(c.Request.Context(), s3Key, 15*time.Minute)
+	signedURL, err := h.storage.GetSignedDownloadURL(c.Request.Context(), s3Key, 15*time.Minute, contentType, filename)
 	if err != nil {
 		h.logger.Error("Failed to generate signed URL", "error", err)
 		c.JSON(http.StatusInternalServerError, ErrorResponse{Error: "Failed to generate download URL"})
@@ -89,3 +112,32 @@ func (h *Handler) DownloadPackage(c *gin.Context) {
 	// Redirect to signed URL
 	c.Redirect(http.StatusTemporaryRedirect, signedURL)
 }
+
+// @Summary Probe package file metadata
+// @Description Return the stored hash and size of a package file without transferring it
+// @Tags packages
+// @Param name path string true "Package name"
+// @Param version path string true "Version"
+// @Param filename path string true "Filename"
+// @Success 200
+// @Failure 404 {object} ErrorResponse
+// @Failure 500 {object} ErrorResponse
+// @Router /download/{name}/{version}/{filename} [head]
+func (h *Handler) HeadPackageFile(c *gin.Context) {
+	name := c.Param("name")
+	version := c.Param("version")
+	filename := c.Param("filename")
+
+	fileInfo := h.lookupPackageFile(c, name, version, filename)
+	if fileInfo == nil {
+		return
+	}
+
+	// Everything a client needs to decide whether to download comes from the
+	// stored metadata, so this never touches S3
+	c.Header("ETag", `"`+fileInfo.Hash+`"`)
+	c.Header("X-Content-SHA256", fileInfo.Hash)
+	c.Header("Content-Length", strconv.FormatInt(fileInfo.Size, 10))
+	c.Header("Cache-Control", "public, max-age=31536000, immutable")
+	c.Status(http.StatusOK)
+}
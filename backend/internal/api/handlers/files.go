@@ -3,16 +3,33 @@ package handlers
 import (
 	"context"
 	"crypto/sha256"
-	"fmt"
+	"encoding/hex"
 	"io"
 	"mime/multipart"
 	"path"
+	"strings"
+	"sync"
 	"time"
 
 	"github.com/Parallels/pd-ai-agents-registry/internal/models"
 )
 
-func (h *Handler) processUploadedFile(ctx context.Context, file *multipart.FileHeader) (*models.File, error) {
+// copyBufPool hands out 1 MiB buffers for hashing uploads; io.Copy's default
+// 32 KiB buffer means ~32x more read calls over a multi-hundred-MB file
+var copyBufPool = sync.Pool{
+	New: func() interface{} {
+		buf := make([]byte, 1<<20)
+		return &buf
+	},
+}
+
+// isSHA256Hex reports whether s looks like a hex-encoded SHA-256 digest
+func isSHA256Hex(s string) bool {
+	sum, err := hex.DecodeString(s)
+	return err == nil && len(sum) == sha256.Size
+}
+
+func (h *Handler) processUploadedFile(ctx context.Context, file *multipart.FileHeader, declaredHash string) (*models.File, error) {
 	// Open the file
 	src, err := file.Open()
 	if err != nil {
@@ -20,26 +37,54 @@ func (h *Handler) processUploadedFile(ctx context.Context, file *multipart.FileH
 	}
 	defer src.Close()
 
-	// Calculate hash
-	hash := sha256.New()
-	if _, err := io.Copy(hash, src); err != nil {
-		return nil, err
-	}
-	fileHash := fmt.Sprintf("%x", hash.Sum(nil))
+	// When the client declares the digest up front we can skip our own
+	// hashing pass over the bytes; S3 verifies the checksum during the
+	// transfer so a bogus declaration fails the upload
+	declaredHash = strings.ToLower(declaredHash)
+	verified := declaredHash != "" && isSHA256Hex(declaredHash)
 
-	// Reset file pointer
-	if _, err := src.Seek(0, 0); err != nil {
-		return nil, err
+	var fileHash string
+	if verified {
+		fileHash = declaredHash
+	} else {
+		// Calculate hash
+		hash := sha256.New()
+		bufp := copyBufPool.Get().(*[]byte)
+		_, err := io.CopyBuffer(hash, src, *bufp)
+		copyBufPool.Put(bufp)
+		if err != nil {
+			return nil, err
+		}
+		fileHash = hex.EncodeToString(hash.Sum(nil))
+
+		// Reset file pointer
+		if _, err := src.Seek(0, 0); err != nil {
+			return nil, err
+		}
 	}
 
 	// Generate S3 key
 	s3Key := path.Join("packages", fileHash, file.Filename)
 
-	// Upload to S3
-	if err := h.storage.Upload(ctx, s3Key, src); err != nil {
+	// The key is content-addressed, so if it already exists the stored bytes
+	// are identical and the transfer can be skipped entirely
+	exists, err := h.storage.Exists(ctx, s3Key)
+	if err != nil {
 		return nil, err
 	}
 
+	if !exists {
+		// Upload to S3
+		if verified {
+			err = h.storage.UploadWithChecksum(ctx, s3Key, src, file.Size, fileHash)
+		} else {
+			err = h.storage.Upload(ctx, s3Key, src, file.Size)
+		}
+		if err != nil {
+			return nil, err
+		}
+	}
+
 	// Generate download URL
 	downloadURL, err := h.storage.GetSignedURL(ctx, s3Key, 24*time.Hour)
 	if err != nil {
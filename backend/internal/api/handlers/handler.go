@@ -1,17 +1,24 @@
 package handlers
 
 import (
+	"time"
+
 	"github.com/Parallels/pd-ai-agents-registry/internal/config"
 	"github.com/Parallels/pd-ai-agents-registry/internal/db/mongodb"
 	"github.com/Parallels/pd-ai-agents-registry/internal/logger"
+	"github.com/Parallels/pd-ai-agents-registry/internal/services/cache"
 	"github.com/Parallels/pd-ai-agents-registry/internal/services/storage"
 )
 
+// cacheTTL bounds how stale cached package/version listings can get
+const cacheTTL = 5 * time.Second
+
 type Handler struct {
 	cfg     *config.Config
 	logger  *logger.Logger
 	db      *mongodb.Client
 	storage *storage.S3Service
+	cache   *cache.Cache
 }
 
 func NewHandler(cfg *config.Config, logger *logger.Logger, db *mongodb.Client) (*Handler, error) {
@@ -26,5 +33,6 @@ func NewHandler(cfg *config.Config, logger *logger.Logger, db *mongodb.Client) (
 		logger:  logger,
 		db:      db,
 		storage: s3Service,
+		cache:   cache.New(cacheTTL),
 	}, nil
 }
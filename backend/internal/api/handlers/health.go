@@ -0,0 +1,22 @@
+package handlers
+
+import (
+	"net/http"
+
+	"github.com/gin-gonic/gin"
+)
+
+// healthPayload is rendered once at startup; probes hit this endpoint
+// constantly and there is nothing request-specific to compute
+var healthPayload = []byte(`{"status":"running","service":"Parallels AI Registry"}`)
+
+// @Summary Health check
+// @Description Report service liveness
+// @Tags health
+// @Produce json
+// @Success 200 {object} map[string]string
+// @Router /health [get]
+func (h *Handler) Health(c *gin.Context) {
+	c.Header("Cache-Control", "no-store")
+	c.Data(http.StatusOK, "application/json", healthPayload)
+}
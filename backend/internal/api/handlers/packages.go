@@ -5,6 +5,7 @@ import (
 
 	"github.com/Parallels/pd-ai-agents-registry/internal/models"
 	"github.com/gin-gonic/gin"
+	"golang.org/x/sync/errgroup"
 )
 
 // @Summary List all packages
@@ -12,17 +13,96 @@ import (
 // @Tags packages
 // @Accept json
 // @Produce json
+// @Param include query string false "Set to 'versions' to embed each package's versions"
 // @Security BearerAuth
 // @Success 200 {array} models.Package
 // @Failure 500 {object} ErrorResponse
 // @Router /packages [get]
 func (h *Handler) ListPackages(c *gin.Context) {
+	includeVersions := c.Query("include") == "versions"
+	cacheKey := "packages"
+	if includeVersions {
+		cacheKey = "packages:versions"
+	}
+	if cached, ok := h.cache.Get(cacheKey); ok {
+		c.JSON(http.StatusOK, cached)
+		return
+	}
+
 	packages, err := h.db.ListPackages(c.Request.Context())
 	if err != nil {
 		h.logger.Error("Failed to list packages", "error", err)
 		c.JSON(http.StatusInternalServerError, ErrorResponse{Error: "Failed to retrieve packages"})
 		return
 	}
+
+	if !includeVersions {
+		h.cache.Set(cacheKey, packages)
+		c.JSON(http.StatusOK, packages)
+		return
+	}
+
+	// Fetch each package's versions concurrently instead of one sequential
+	// query per package
+	detailed := make([]PackageDetails, len(packages))
+	g, gctx := errgroup.WithContext(c.Request.Context())
+	g.SetLimit(8)
+	for i := range packages {
+		i := i
+		g.Go(func() error {
+			versions, err := h.db.ListVersions(gctx, packages[i].ID)
+			if err != nil {
+				return err
+			}
+			detailed[i] = PackageDetails{Package: packages[i], Versions: versions}
+			return nil
+		})
+	}
+	if err := g.Wait(); err != nil {
+		h.logger.Error("Failed to list package versions", "error", err)
+		c.JSON(http.StatusInternalServerError, ErrorResponse{Error: "Failed to retrieve packages"})
+		return
+	}
+
+	h.cache.Set(cacheKey, detailed)
+	c.JSON(http.StatusOK, detailed)
+}
+
+// maxBatchGetNames bounds how many packages one batch request may resolve
+const maxBatchGetNames = 500
+
+type BatchGetRequest struct {
+	Names []string `json:"names" binding:"required"`
+}
+
+// @Summary Batch get packages
+// @Description Get details for several packages in one request
+// @Tags packages
+// @Accept json
+// @Produce json
+// @Param body body BatchGetRequest true "Package names (max 500)"
+// @Security BearerAuth
+// @Success 200 {array} models.Package
+// @Failure 400 {object} ErrorResponse
+// @Failure 500 {object} ErrorResponse
+// @Router /packages/batch [post]
+func (h *Handler) BatchGetPackages(c *gin.Context) {
+	var req BatchGetRequest
+	if err := c.ShouldBindJSON(&req); err != nil {
+		c.JSON(http.StatusBadRequest, ErrorResponse{Error: "Invalid request"})
+		return
+	}
+	if len(req.Names) > maxBatchGetNames {
+		c.JSON(http.StatusBadRequest, ErrorResponse{Error: "Too many names in batch request"})
+		return
+	}
+
+	packages, err := h.db.GetPackagesByNames(c.Request.Context(), req.Names)
+	if err != nil {
+		h.logger.Error("Failed to batch get packages", "error", err)
+		c.JSON(http.StatusInternalServerError, ErrorResponse{Error: "Failed to retrieve packages"})
+		return
+	}
 	c.JSON(http.StatusOK, packages)
 }
 
@@ -39,6 +119,11 @@ func (h *Handler) ListPackages(c *gin.Context) {
 // @Router /packages/{name} [get]
 func (h *Handler) GetPackage(c *gin.Context) {
 	name := c.Param("name")
+	if cached, ok := h.cache.Get("package:" + name); ok {
+		c.JSON(http.StatusOK, cached)
+		return
+	}
+
 	pkg, err := h.db.GetPackage(c.Request.Context(), name)
 	if err != nil {
 		h.logger.Error("Failed to get package", "error", err, "name", name)
@@ -49,6 +134,7 @@ func (h *Handler) GetPackage(c *gin.Context) {
 		c.JSON(http.StatusNotFound, ErrorResponse{Error: "Package not found"})
 		return
 	}
+	h.cache.Set("package:"+name, pkg)
 	c.JSON(http.StatusOK, pkg)
 }
 
@@ -65,25 +151,23 @@ func (h *Handler) GetPackage(c *gin.Context) {
 // @Router /packages/{name}/versions [get]
 func (h *Handler) ListVersions(c *gin.Context) {
 	name := c.Param("name")
-
-	// First get the package to get its ID
-	pkg, err := h.db.GetPackage(c.Request.Context(), name)
-	if err != nil {
-		h.logger.Error("Failed to get package", "error", err, "name", name)
-		c.JSON(http.StatusInternalServerError, ErrorResponse{Error: "Failed to retrieve package"})
-		return
-	}
-	if pkg == nil {
-		c.JSON(http.StatusNotFound, ErrorResponse{Error: "Package not found"})
+	if cached, ok := h.cache.Get("versions:" + name); ok {
+		c.JSON(http.StatusOK, cached)
 		return
 	}
 
-	versions, err := h.db.ListVersions(c.Request.Context(), pkg.ID)
+	// Resolve the package and its versions in a single round trip
+	versions, found, err := h.db.ListVersionsByPackageName(c.Request.Context(), name)
 	if err != nil {
 		h.logger.Error("Failed to list versions", "error", err, "package", name)
 		c.JSON(http.StatusInternalServerError, ErrorResponse{Error: "Failed to retrieve versions"})
 		return
 	}
+	if !found {
+		c.JSON(http.StatusNotFound, ErrorResponse{Error: "Package not found"})
+		return
+	}
+	h.cache.Set("versions:"+name, versions)
 	c.JSON(http.StatusOK, versions)
 }
 
@@ -102,28 +186,27 @@ func (h *Handler) ListVersions(c *gin.Context) {
 func (h *Handler) GetVersion(c *gin.Context) {
 	name := c.Param("name")
 	version := c.Param("version")
-
-	pkg, err := h.db.GetPackage(c.Request.Context(), name)
-	if err != nil {
-		h.logger.Error("Failed to get package", "error", err, "name", name)
-		c.JSON(http.StatusInternalServerError, ErrorResponse{Error: "Failed to retrieve package"})
-		return
-	}
-	if pkg == nil {
-		c.JSON(http.StatusNotFound, ErrorResponse{Error: "Package not found"})
+	if cached, ok := h.cache.Get("version:" + name + ":" + version); ok {
+		c.JSON(http.StatusOK, cached)
 		return
 	}
 
-	ver, err := h.db.GetVersion(c.Request.Context(), pkg.ID, version)
+	// Resolve the package and the requested version in a single round trip
+	ver, found, err := h.db.GetVersionByPackageName(c.Request.Context(), name, version)
 	if err != nil {
 		h.logger.Error("Failed to get version", "error", err, "package", name, "version", version)
 		c.JSON(http.StatusInternalServerError, ErrorResponse{Error: "Failed to retrieve version"})
 		return
 	}
+	if !found {
+		c.JSON(http.StatusNotFound, ErrorResponse{Error: "Package not found"})
+		return
+	}
 	if ver == nil {
 		c.JSON(http.StatusNotFound, ErrorResponse{Error: "Version not found"})
 		return
 	}
+	h.cache.Set("version:"+name+":"+version, ver)
 	c.JSON(http.StatusOK, ver)
 }
 
@@ -164,8 +247,9 @@ func (h *Handler) UploadPackage(c *gin.Context) {
 		return
 	}
 
-	// Process and store the file
-	fileModel, err := h.processUploadedFile(c.Request.Context(), file)
+	// Process and store the file, trusting a client-declared digest when
+	// one is sent (S3 verifies it during the transfer)
+	fileModel, err := h.processUploadedFile(c.Request.Context(), file, c.GetHeader("X-Content-SHA256"))
 	if err != nil {
 		h.logger.Error("Failed to process file", "error", err)
 		c.JSON(http.StatusInternalServerError, ErrorResponse{Error: "Failed to process uploaded file"})
@@ -201,6 +285,10 @@ func (h *Handler) UploadPackage(c *gin.Context) {
 		}
 	}
 
+	// Drop cached listings now that the version metadata changed
+	h.cache.InvalidatePrefix("package")
+	h.cache.InvalidatePrefix("version")
+
 	c.JSON(http.StatusOK, UploadResponse{
 		Message: "File uploaded successfully",
 		File:    fileModel,
@@ -225,22 +313,27 @@ func (h *Handler) DeletePackage(c *gin.Context) {
 	version := c.Param("version")
 	filename := c.Param("filename")
 
-	pkg, err := h.db.GetPackage(c.Request.Context(), name)
+	// Only the ID is needed here; skip transferring the full package document
+	pkgID, err := h.db.GetPackageID(c.Request.Context(), name)
 	if err != nil {
 		h.logger.Error("Failed to get package", "error", err)
 		c.JSON(http.StatusInternalServerError, ErrorResponse{Error: "Failed to retrieve package"})
 		return
 	}
-	if pkg == nil {
+	if pkgID.IsZero() {
 		c.JSON(http.StatusNotFound, ErrorResponse{Error: "Package not found"})
 		return
 	}
 
-	if err := h.db.RemoveFileFromVersion(c.Request.Context(), pkg.ID, version, filename); err != nil {
+	if err := h.db.RemoveFileFromVersion(c.Request.Context(), pkgID, version, filename); err != nil {
 		h.logger.Error("Failed to remove file", "error", err)
 		c.JSON(http.StatusInternalServerError, ErrorResponse{Error: "Failed to remove file"})
 		return
 	}
 
+	// Drop cached listings now that the version metadata changed
+	h.cache.InvalidatePrefix("package")
+	h.cache.InvalidatePrefix("version")
+
 	c.JSON(http.StatusOK, SuccessResponse{Message: "File deleted successfully"})
 }
@@ -14,3 +14,8 @@ type UploadResponse struct {
 	Message string       `json:"message"`
 	File    *models.File `json:"file"`
 }
+
+type PackageDetails struct {
+	models.Package
+	Versions []models.Version `json:"versions"`
+}
@@ -15,6 +15,7 @@ import (
 	"go.mongodb.org/mongo-driver/bson"
 	"go.mongodb.org/mongo-driver/mongo"
 	"go.mongodb.org/mongo-driver/mongo/options"
+	"golang.org/x/sync/errgroup"
 )
 
 // UploadUpdate handles uploading a new application update
@@ -58,7 +59,9 @@ func (h *Handler) UploadUpdate(c *gin.Context) {
 
 	version = strings.TrimPrefix(version, "v")
 
-	// Check if version already exists for this platform and architecture
+	// Check if version already exists for this platform and architecture;
+	// limit the count to 1 so Mongo stops at the first match instead of
+	// scanning every matching document
 	collection := h.db.Database().Collection("updates")
 	count, err := collection.CountDocuments(
 		c.Request.Context(),
@@ -67,6 +70,7 @@ func (h *Handler) UploadUpdate(c *gin.Context) {
 			"platform": platform,
 			"arch":     arch,
 		},
+		options.Count().SetLimit(1),
 	)
 	if err != nil {
 		h.logger.Error("Failed to check for existing update", err)
@@ -79,22 +83,35 @@ func (h *Handler) UploadUpdate(c *gin.Context) {
 		return
 	}
 
-	// Get file from form
-	file, header, err := c.Request.FormFile("file")
+	// Get file from form; going through gin keeps the parse bounded by the
+	// router's MaxMultipartMemory instead of net/http's 32 MB default
+	header, err := c.FormFile("file")
 	if err != nil {
 		h.logger.Error("Failed to get file from form", err)
 		c.JSON(http.StatusBadRequest, ErrorResponse{Error: "Failed to get file from form"})
 		return
 	}
+	file, err := header.Open()
+	if err != nil {
+		h.logger.Error("Failed to open uploaded file", err)
+		c.JSON(http.StatusInternalServerError, ErrorResponse{Error: "Failed to open uploaded file"})
+		return
+	}
 	defer file.Close()
 
 	// get signature file from form
-	signature, _, err := c.Request.FormFile("signature")
+	sigHeader, err := c.FormFile("signature")
 	if err != nil {
 		h.logger.Error("Failed to get signature file from form", err)
 		c.JSON(http.StatusBadRequest, ErrorResponse{Error: "Failed to get signature file from form"})
 		return
 	}
+	signature, err := sigHeader.Open()
+	if err != nil {
+		h.logger.Error("Failed to open signature file", err)
+		c.JSON(http.StatusInternalServerError, ErrorResponse{Error: "Failed to open signature file"})
+		return
+	}
 	defer signature.Close()
 
 	// Read signature file content
@@ -105,19 +122,16 @@ func (h *Handler) UploadUpdate(c *gin.Context) {
 		return
 	}
 
-	// Reset reader position for later upload
-	_, _ = signature.Seek(0, 0)
-
 	// upload update file to s3
-	updateKey := fmt.Sprintf("updates/%s/%s/%s/%s", version, platform, arch, header.Filename)
-	if err := h.storage.Upload(c.Request.Context(), updateKey, file); err != nil {
+	updateKey := "updates/" + version + "/" + platform + "/" + arch + "/" + header.Filename
+	if err := h.storage.Upload(c.Request.Context(), updateKey, file, header.Size); err != nil {
 		h.logger.Error("Failed to upload update file to S3", err)
 		c.JSON(http.StatusInternalServerError, ErrorResponse{Error: "Failed to upload update file to S3"})
 		return
 	}
 
 	// Create download URL
-	downloadURL := fmt.Sprintf("/api/v1/updates/download/%s/%s/%s/%s", version, platform, arch, header.Filename)
+	downloadURL := "/api/v1/updates/download/" + version + "/" + platform + "/" + arch + "/" + header.Filename
 
 	// Create update record in database
 	now := time.Now()
@@ -147,11 +161,15 @@ func (h *Handler) UploadUpdate(c *gin.Context) {
 		return
 	}
 
-	// Update the LatestVersion document
-	if err := h.updateLatestVersionDocument(c.Request.Context(), update); err != nil {
-		h.logger.Error("Failed to update latest version document", err)
-		// Don't return an error to the client, as the upload was successful
-	}
+	// Maintain the LatestVersion document off the request path; the upload
+	// result does not depend on it and failures are only logged anyway
+	go func(update models.Update) {
+		ctx, cancel := context.WithTimeout(context.Background(), 30*time.Second)
+		defer cancel()
+		if err := h.updateLatestVersionDocument(ctx, update); err != nil {
+			h.logger.Error("Failed to update latest version document", err)
+		}
+	}(update)
 
 	// Return success
 	c.JSON(http.StatusCreated, gin.H{
@@ -190,23 +208,39 @@ func (h *Handler) GetLatestUpdate(c *gin.Context) {
 		return
 	}
 
-	// Find the latest update for the platform
+	// Find the latest update for the platform. Picking the maximum needs a
+	// numeric semver comparison; a bytewise sort on the version string
+	// would rank 9.0.0 above 10.0.0.
 	collection := h.db.Database().Collection("updates")
 
-	// Sort by version in descending order (assuming semantic versioning)
-	opts := options.FindOne().SetSort(bson.D{{Key: "version", Value: -1}})
-
-	var update models.Update
-	err := collection.FindOne(
+	cursor, err := collection.Find(
 		c.Request.Context(),
 		bson.M{"platform": platform, "arch": arch},
-		opts,
-	).Decode(&update)
+	)
 	if err != nil {
 		h.logger.Error("Failed to find latest update", err)
 		c.JSON(http.StatusNotFound, ErrorResponse{Error: "No updates found for this platform"})
 		return
 	}
+	defer cursor.Close(c.Request.Context())
+
+	var update models.Update
+	found := false
+	for cursor.Next(c.Request.Context()) {
+		var candidate models.Update
+		if err := cursor.Decode(&candidate); err != nil {
+			h.logger.Error("Failed to decode update", err)
+			continue
+		}
+		if !found || compareVersions(candidate.Version, update.Version) > 0 {
+			update = candidate
+			found = true
+		}
+	}
+	if !found {
+		c.JSON(http.StatusNotFound, ErrorResponse{Error: "No updates found for this platform"})
+		return
+	}
 
 	// Return update metadata
 	metadata := models.UpdateMetadata{
@@ -256,54 +290,45 @@ func (h *Handler) DownloadUpdate(c *gin.Context) {
 	// Trim v prefix if present
 	version = strings.TrimPrefix(version, "v")
 
-	// Generate S3 key
-	key := fmt.Sprintf("updates/%s/%s/%s/%s", version, platform, arch, filename)
-
-	// Check if file exists
-	exists, err := h.storage.Exists(c.Request.Context(), key)
-	if err != nil {
-		h.logger.Error("Failed to check if update file exists", err)
-		c.JSON(http.StatusInternalServerError, ErrorResponse{Error: "Failed to check if update file exists"})
-		return
-	}
+	// Generate S3 key; concatenation keeps Sprintf's formatting machinery
+	// off the download hot path
+	key := "updates/" + version + "/" + platform + "/" + arch + "/" + filename
 
-	if !exists {
-		c.JSON(http.StatusNotFound, ErrorResponse{Error: "Update file not found"})
-		return
-	}
-
-	// Get file size
-	size, err := h.storage.Size(c.Request.Context(), key)
+	// The update record written at upload time is the source of truth for
+	// what is in storage; checking it replaces a HeadObject round trip to S3
+	collection := h.db.Database().Collection("updates")
+	err := collection.FindOne(
+		c.Request.Context(),
+		bson.M{
+			"version":  version,
+			"platform": platform,
+			"arch":     arch,
+			"filename": filename,
+		},
+		options.FindOne().SetProjection(bson.M{"_id": 1}),
+	).Err()
 	if err != nil {
-		h.logger.Error("Failed to get file size", err)
-		c.JSON(http.StatusInternalServerError, ErrorResponse{Error: "Failed to get file size"})
+		if err == mongo.ErrNoDocuments {
+			c.JSON(http.StatusNotFound, ErrorResponse{Error: "Update file not found"})
+			return
+		}
+		h.logger.Error("Failed to check update record", err)
+		c.JSON(http.StatusInternalServerError, ErrorResponse{Error: "Failed to check update file"})
 		return
 	}
 
-	c.Header("Content-Length", strconv.Itoa(int(size)))
-
-	// Get file from S3
-	reader, err := h.storage.Download(c.Request.Context(), key)
+	// Redirect to a signed URL so the bytes flow straight from S3 to the
+	// client instead of being copied through this process; the presigned
+	// request overrides the response headers so clients still see the real
+	// content type and an attachment disposition
+	signedURL, err := h.storage.GetSignedDownloadURL(c.Request.Context(), key, 15*time.Minute, getContentType(filename), filename)
 	if err != nil {
-		h.logger.Error("Failed to download update file", err)
-		c.JSON(http.StatusInternalServerError, ErrorResponse{Error: "Failed to download update file"})
+		h.logger.Error("Failed to generate signed URL", err)
+		c.JSON(http.StatusInternalServerError, ErrorResponse{Error: "Failed to generate download URL"})
 		return
 	}
-	defer reader.Close()
-
-	// Set content disposition header
-	c.Header("Content-Disposition", fmt.Sprintf("attachment; filename=%s", filename))
-
-	// Set content type based on file extension
-	contentType := getContentType(filename)
-	c.Header("Content-Type", contentType)
 
-	// Stream file to response
-	c.Status(http.StatusOK)
-	_, err = io.Copy(c.Writer, reader)
-	if err != nil {
-		h.logger.Error("Failed to stream update file", err)
-	}
+	c.Redirect(http.StatusTemporaryRedirect, signedURL)
 }
 
 // ListUpdates lists all available updates
@@ -333,17 +358,16 @@ func (h *Handler) ListUpdates(c *gin.Context) {
 	}
 	defer cursor.Close(c.Request.Context())
 
-	// Decode updates
-	var updates []models.Update
-	if err := cursor.All(c.Request.Context(), &updates); err != nil {
-		h.logger.Error("Failed to decode updates", err)
-		c.JSON(http.StatusInternalServerError, ErrorResponse{Error: "Failed to decode updates"})
-		return
-	}
-
-	// Convert to metadata
-	var metadata []models.UpdateMetadata
-	for _, update := range updates {
+	// Decode each document straight into the metadata slice instead of
+	// materializing the full []models.Update first and copying it over
+	metadata := []models.UpdateMetadata{}
+	for cursor.Next(c.Request.Context()) {
+		var update models.Update
+		if err := cursor.Decode(&update); err != nil {
+			h.logger.Error("Failed to decode updates", err)
+			c.JSON(http.StatusInternalServerError, ErrorResponse{Error: "Failed to decode updates"})
+			return
+		}
 		metadata = append(metadata, models.UpdateMetadata{
 			Version:     update.Version,
 			Platform:    update.Platform,
@@ -353,6 +377,11 @@ func (h *Handler) ListUpdates(c *gin.Context) {
 			DownloadURL: update.DownloadURL,
 		})
 	}
+	if err := cursor.Err(); err != nil {
+		h.logger.Error("Failed to decode updates", err)
+		c.JSON(http.StatusInternalServerError, ErrorResponse{Error: "Failed to decode updates"})
+		return
+	}
 
 	c.JSON(http.StatusOK, metadata)
 }
@@ -408,23 +437,29 @@ func (h *Handler) DeleteUpdate(c *gin.Context) {
 		return
 	}
 
-	// Delete the update file from S3
-	updateKey := fmt.Sprintf("updates/%s/%s/%s/%s", version, platform, arch, update.Filename)
-	if err := h.storage.Delete(c.Request.Context(), updateKey); err != nil {
+	// Delete the update and signature files from S3 concurrently instead of
+	// paying one round trip after the other
+	g, gctx := errgroup.WithContext(c.Request.Context())
+	updateKey := "updates/" + version + "/" + platform + "/" + arch + "/" + update.Filename
+	g.Go(func() error {
+		return h.storage.Delete(gctx, updateKey)
+	})
+	if update.Signature != "" {
+		signatureKey := "updates/" + version + "/" + platform + "/" + arch + "/" + update.Signature
+		g.Go(func() error {
+			if err := h.storage.Delete(gctx, signatureKey); err != nil {
+				h.logger.Error("Failed to delete signature file from S3", err)
+				// Continue anyway, as this is not critical
+			}
+			return nil
+		})
+	}
+	if err := g.Wait(); err != nil {
 		h.logger.Error("Failed to delete update file from S3", err)
 		c.JSON(http.StatusInternalServerError, ErrorResponse{Error: "Failed to delete update file"})
 		return
 	}
 
-	// Delete the signature file from S3 if it exists
-	if update.Signature != "" {
-		signatureKey := fmt.Sprintf("updates/%s/%s/%s/%s", version, platform, arch, update.Signature)
-		if err := h.storage.Delete(c.Request.Context(), signatureKey); err != nil {
-			h.logger.Error("Failed to delete signature file from S3", err)
-			// Continue anyway, as this is not critical
-		}
-	}
-
 	// Delete the update from the database
 	result, err := collection.DeleteOne(
 		c.Request.Context(),
@@ -479,40 +514,53 @@ func isValidArch(arch string) bool {
 	return validArchs[arch]
 }
 
+// allPlatformKeys is the fixed platform-arch cross product; computed once
+// instead of being rebuilt on every latest-version read and write
+var allPlatformKeys = generateAllPlatformKeys()
+
 func generateAllPlatformKeys() []string {
 	platforms := []string{"windows", "darwin", "linux"}
 	archs := []string{"x86_64", "i686", "armv7", "aarch64"}
-	keys := []string{}
+	keys := make([]string, 0, len(platforms)*len(archs))
 	for _, platform := range platforms {
 		for _, arch := range archs {
-			keys = append(keys, fmt.Sprintf("%s-%s", platform, arch))
+			keys = append(keys, platform+"-"+arch)
 		}
 	}
 	return keys
 }
 
+// contentTypesByExt maps single-segment extensions to content types; built
+// once instead of being re-evaluated per call
+var contentTypesByExt = map[string]string{
+	".zip": "application/zip",
+	".exe": "application/octet-stream",
+	".dmg": "application/x-apple-diskimage",
+	".deb": "application/vnd.debian.binary-package",
+	".rpm": "application/x-rpm",
+}
+
+// contentTypesBySuffix covers compound extensions like .tar.gz, which
+// filepath.Ext cannot see (it only returns the final segment, ".gz")
+var contentTypesBySuffix = []struct {
+	suffix      string
+	contentType string
+}{
+	{".tar.gz", "application/x-gzip"},
+	{".tar.xz", "application/x-xz"},
+	{".tar.bz2", "application/x-bzip2"},
+}
+
 func getContentType(filename string) string {
-	ext := filepath.Ext(filename)
-	switch ext {
-	case ".zip":
-		return "application/zip"
-	case ".exe":
-		return "application/octet-stream"
-	case ".dmg":
-		return "application/x-apple-diskimage"
-	case ".deb":
-		return "application/vnd.debian.binary-package"
-	case ".rpm":
-		return "application/x-rpm"
-	case ".tar.gz":
-		return "application/x-gzip"
-	case ".tar.xz":
-		return "application/x-xz"
-	case ".tar.bz2":
-		return "application/x-bzip2"
-	default:
-		return "application/octet-stream"
+	for _, s := range contentTypesBySuffix {
+		if strings.HasSuffix(filename, s.suffix) {
+			return s.contentType
+		}
+	}
+	if ct, ok := contentTypesByExt[filepath.Ext(filename)]; ok {
+		return ct
 	}
+	return "application/octet-stream"
 }
 
 // updateLatestVersionDocument updates the LatestVersion document with the latest update information
@@ -537,7 +585,7 @@ func (h *Handler) updateLatestVersionDocument(ctx context.Context, update models
 	}
 
 	// Update the platform-specific information
-	platformKey := fmt.Sprintf("%s-%s", update.Platform, update.Arch)
+	platformKey := update.Platform + "-" + update.Arch
 	platformInfo := models.LatestVersionPlatform{
 		URL: update.DownloadURL,
 	}
@@ -548,7 +596,7 @@ func (h *Handler) updateLatestVersionDocument(ctx context.Context, update models
 	}
 
 	// Ensure all platform keys are present
-	for _, platformKey := range generateAllPlatformKeys() {
+	for _, platformKey := range allPlatformKeys {
 		if _, ok := latestVersion.Platforms[platformKey]; !ok {
 			if latestVersion.Platforms == nil {
 				latestVersion.Platforms = make(map[string]models.LatestVersionPlatform)
@@ -641,9 +689,9 @@ func (h *Handler) GetLatestVersionInfo(c *gin.Context) {
 
 	// Sort the platforms by platform key
 	platforms := make(map[string]models.LatestVersionPlatform)
-	for _, platform := range generateAllPlatformKeys() {
+	for _, platform := range allPlatformKeys {
 		if info, ok := latestVersion.Platforms[platform]; ok {
-			info.URL = fmt.Sprintf("%s%s", h.cfg.GetBaseURL(), info.URL)
+			info.URL = h.cfg.GetBaseURL() + info.URL
 			platforms[platform] = info
 		}
 	}
@@ -10,16 +10,25 @@ import (
 
 type AuthMiddleware struct {
 	jwtSecret string
-	apiKeys   map[string]bool // In production, this should come from a database
+	// jwtKey and keyFunc are built once at construction so token parsing
+	// does not convert the secret and allocate a closure per request
+	jwtKey  []byte
+	keyFunc jwt.Keyfunc
+	apiKeys map[string]bool // In production, this should come from a database
 }
 
 func NewAuthMiddleware(jwtSecret string) *AuthMiddleware {
-	return &AuthMiddleware{
+	m := &AuthMiddleware{
 		jwtSecret: jwtSecret,
+		jwtKey:    []byte(jwtSecret),
 		apiKeys: map[string]bool{
 			"test-api-key": true, // For testing purposes
 		},
 	}
+	m.keyFunc = func(token *jwt.Token) (interface{}, error) {
+		return m.jwtKey, nil
+	}
+	return m
 }
 
 func (m *AuthMiddleware) JWT() gin.HandlerFunc {
@@ -38,9 +47,7 @@ func (m *AuthMiddleware) JWT() gin.HandlerFunc {
 			return
 		}
 
-		token, err := jwt.Parse(tokenString, func(token *jwt.Token) (interface{}, error) {
-			return []byte(m.jwtSecret), nil
-		})
+		token, err := jwt.Parse(tokenString, m.keyFunc)
 
 		if err != nil || !token.Valid {
 			c.JSON(http.StatusUnauthorized, gin.H{"error": "Invalid token"})
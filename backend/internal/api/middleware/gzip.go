@@ -0,0 +1,69 @@
+package middleware
+
+import (
+	"compress/gzip"
+	"strings"
+	"sync"
+
+	"github.com/gin-gonic/gin"
+)
+
+// Pool the gzip writers; allocating one per request costs more than the
+// compression itself on small payloads. Level 5 is the sweet spot between
+// ratio and CPU for JSON.
+var gzipPool = sync.Pool{
+	New: func() interface{} {
+		w, _ := gzip.NewWriterLevel(nil, 5)
+		return w
+	},
+}
+
+type gzipResponseWriter struct {
+	gin.ResponseWriter
+	gz      *gzip.Writer
+	written bool
+}
+
+func (w *gzipResponseWriter) Write(data []byte) (int, error) {
+	w.written = true
+	return w.gz.Write(data)
+}
+
+func (w *gzipResponseWriter) WriteString(s string) (int, error) {
+	w.written = true
+	return w.gz.Write([]byte(s))
+}
+
+// Gzip compresses response bodies for clients that advertise support.
+// Meant for the JSON metadata endpoints; file downloads redirect to S3 and
+// never pass a body through here.
+func Gzip() gin.HandlerFunc {
+	return func(c *gin.Context) {
+		if !strings.Contains(c.GetHeader("Accept-Encoding"), "gzip") {
+			c.Next()
+			return
+		}
+
+		gz := gzipPool.Get().(*gzip.Writer)
+		gz.Reset(c.Writer)
+
+		gzw := &gzipResponseWriter{ResponseWriter: c.Writer, gz: gz}
+		c.Writer = gzw
+		c.Header("Content-Encoding", "gzip")
+		c.Header("Vary", "Accept-Encoding")
+
+		c.Next()
+
+		if gzw.written {
+			if err := gz.Close(); err != nil {
+				_ = c.Error(err)
+			}
+		} else {
+			// Nothing was written (bare status response); drop the encoding
+			// header instead of emitting an empty gzip stream
+			c.Writer.Header().Del("Content-Encoding")
+		}
+		c.Writer = gzw.ResponseWriter
+		gzipPool.Put(gz)
+	}
+}
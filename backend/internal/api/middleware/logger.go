@@ -5,9 +5,14 @@ import (
 
 	"github.com/Parallels/pd-ai-agents-registry/internal/logger"
 	"github.com/gin-gonic/gin"
+	"go.uber.org/zap"
 )
 
 func Logger(log *logger.Logger) gin.HandlerFunc {
+	// Desugar once up front; typed fields avoid the sugared logger's
+	// per-request reflection and interface allocations on the hot path
+	zl := log.Desugar()
+
 	return func(c *gin.Context) {
 		start := time.Now()
 		path := c.Request.URL.Path
@@ -18,12 +23,12 @@ func Logger(log *logger.Logger) gin.HandlerFunc {
 		latency := time.Since(start)
 		statusCode := c.Writer.Status()
 
-		log.Infow("Request",
-			"method", method,
-			"path", path,
-			"status", statusCode,
-			"latency", latency,
-			"ip", c.ClientIP(),
+		zl.Info("Request",
+			zap.String("method", method),
+			zap.String("path", path),
+			zap.Int("status", statusCode),
+			zap.Duration("latency", latency),
+			zap.String("ip", c.ClientIP()),
 		)
 	}
 }
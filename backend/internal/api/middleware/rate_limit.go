@@ -2,6 +2,7 @@ package middleware
 
 import (
 	"sync"
+	"sync/atomic"
 	"time"
 
 	"github.com/gin-gonic/gin"
@@ -15,8 +16,10 @@ type RateLimitConfig struct {
 }
 
 type visitor struct {
-	limiter  *rate.Limiter
-	lastSeen time.Time
+	limiter *rate.Limiter
+	// lastSeen holds unix nanos and is updated atomically so the read-lock
+	// fast path in getVisitor never needs the write lock
+	lastSeen atomic.Int64
 }
 
 type RateLimiter struct {
@@ -42,7 +45,7 @@ func (rl *RateLimiter) cleanup() {
 		time.Sleep(time.Minute)
 		rl.mu.Lock()
 		for ip, v := range rl.visitors {
-			if time.Since(v.lastSeen) > rl.config.ExpiryTime {
+			if time.Since(time.Unix(0, v.lastSeen.Load())) > rl.config.ExpiryTime {
 				delete(rl.visitors, ip)
 			}
 		}
@@ -51,21 +54,30 @@ func (rl *RateLimiter) cleanup() {
 }
 
 func (rl *RateLimiter) getVisitor(ip string) *rate.Limiter {
+	// Fast path: returning visitors only need the read lock, so concurrent
+	// downloads no longer serialize on the map mutex
+	rl.mu.RLock()
+	v, exists := rl.visitors[ip]
+	rl.mu.RUnlock()
+	if exists {
+		v.lastSeen.Store(time.Now().UnixNano())
+		return v.limiter
+	}
+
 	rl.mu.Lock()
 	defer rl.mu.Unlock()
 
-	v, exists := rl.visitors[ip]
-	if !exists {
-		limiter := rate.NewLimiter(rate.Limit(rl.config.RequestsPerSecond), rl.config.BurstSize)
-		rl.visitors[ip] = &visitor{
-			limiter:  limiter,
-			lastSeen: time.Now(),
-		}
-		return limiter
+	// Re-check under the write lock; another request may have just added it
+	if v, exists := rl.visitors[ip]; exists {
+		v.lastSeen.Store(time.Now().UnixNano())
+		return v.limiter
 	}
 
-	v.lastSeen = time.Now()
-	return v.limiter
+	limiter := rate.NewLimiter(rate.Limit(rl.config.RequestsPerSecond), rl.config.BurstSize)
+	v = &visitor{limiter: limiter}
+	v.lastSeen.Store(time.Now().UnixNano())
+	rl.visitors[ip] = v
+	return limiter
 }
 
 // RateLimit middleware factory
@@ -18,6 +18,11 @@ func NewRouter(cfg *config.Config, logger *logger.Logger, db *mongodb.Client) *g
 	router.Use(gin.Recovery())
 	router.Use(middleware.Logger(logger))
 
+	// Keep at most 8 MiB of a multipart upload in memory; anything larger
+	// spills to a temp file instead of buffering whole packages in RAM
+	// (gin's default is 32 MiB per request)
+	router.MaxMultipartMemory = 8 << 20
+
 	// Initialize handlers
 	h, err := handlers.NewHandler(cfg, logger, db)
 	if err != nil {
@@ -32,6 +37,10 @@ func NewRouter(cfg *config.Config, logger *logger.Logger, db *mongodb.Client) *g
 		ExpiryTime:        time.Minute * 5, // Clean up visitors after 5 minutes
 	})
 
+	// Health check (prebuilt payload, no auth, no logging overhead beyond
+	// the shared middleware)
+	router.GET("/health", h.Health)
+
 	// Swagger docs
 	router.GET("/swagger/*any", ginSwagger.WrapHandler(swaggerFiles.Handler))
 
@@ -44,9 +53,11 @@ func NewRouter(cfg *config.Config, logger *logger.Logger, db *mongodb.Client) *g
 
 		// Protected routes
 		packages := v1.Group("/packages")
+		packages.Use(middleware.Gzip())
 		packages.Use(auth.JWT())
 		{
 			packages.GET("", h.ListPackages)
+			packages.POST("/batch", h.BatchGetPackages)
 			packages.GET("/:name", h.GetPackage)
 			packages.GET("/:name/versions", h.ListVersions)
 			packages.GET("/:name/versions/:version", h.GetVersion)
@@ -60,17 +71,20 @@ func NewRouter(cfg *config.Config, logger *logger.Logger, db *mongodb.Client) *g
 			}
 		}
 
-		// Download route (public with rate limiting)
+		// Download route (public with rate limiting); HEAD lets clients check
+		// the stored hash and size before committing to a transfer
 		v1.GET("/download/:name/:version/:filename", downloadRateLimit, h.DownloadPackage)
+		v1.HEAD("/download/:name/:version/:filename", downloadRateLimit, h.HeadPackageFile)
 
 		// Update routes
 		updates := v1.Group("/updates")
 		{
-			// Public routes
-			updates.GET("", h.ListUpdates)
-			updates.GET("/latest/:platform/:arch", h.GetLatestUpdate)
+			// Public routes (JSON listings are gzip-compressed; the download
+			// route redirects to S3 and has nothing to compress)
+			updates.GET("", middleware.Gzip(), h.ListUpdates)
+			updates.GET("/latest/:platform/:arch", middleware.Gzip(), h.GetLatestUpdate)
 			updates.GET("/download/:version/:platform/:arch/:filename", downloadRateLimit, h.DownloadUpdate)
-			updates.GET("/latest", h.GetLatestVersionInfo)
+			updates.GET("/latest", middleware.Gzip(), h.GetLatestVersionInfo)
 
 			// Protected routes (admin only)
 			adminUpdates := updates.Group("")
@@ -130,28 +130,11 @@ func Load() (*Config, error) {
 	// Create config struct
 	config := &Config{}
 
-	// Debug print all viper settings before unmarshaling
-	log.Printf("Viper settings before unmarshaling:")
-	for _, key := range v.AllKeys() {
-		log.Printf("%s: %v", key, v.Get(key))
-	}
-
 	// Unmarshal config
 	if err := v.Unmarshal(config); err != nil {
 		return nil, fmt.Errorf("error unmarshaling config: %w", err)
 	}
 
-	// Debug print the config struct after unmarshaling
-	log.Printf("Config struct after unmarshaling:")
-	log.Printf("port=%s, S3 Config: Region=%s, Bucket=%s, AccessKeyID=%s, SecretAccessKey=%s, Endpoint=%s",
-		config.Server.Port,
-		config.S3.Region,
-		config.S3.Bucket,
-		config.S3.AccessKeyID,
-		config.S3.SecretAccessKey,
-		config.S3.Endpoint,
-	)
-
 	if config.Server.Host == "" {
 		config.Server.Host = "localhost"
 	}
@@ -34,8 +34,11 @@ func (s *AdminSeeder) Seed(ctx context.Context) error {
 	var existingUser bson.M
 	err := collection.FindOne(ctx, bson.M{"email": adminEmail}).Decode(&existingUser)
 	if err == nil {
-		// Admin exists, check if password needs update
-		if existingUser["password"] != s.password {
+		// Admin exists, check if password needs update. The stored value is a
+		// bcrypt hash, so compare against it instead of the plaintext; a direct
+		// string comparison never matches and re-hashes on every startup
+		storedHash, _ := existingUser["password"].(string)
+		if bcrypt.CompareHashAndPassword([]byte(storedHash), []byte(s.password)) != nil {
 			log.Printf("Updating admin password")
 			hashedPassword, err := bcrypt.GenerateFromPassword([]byte(s.password), bcrypt.DefaultCost)
 			if err != nil {
@@ -18,7 +18,15 @@ func NewClient(ctx context.Context, cfg config.MongoDBConfig) (*Client, error) {
 	ctx, cancel := context.WithTimeout(ctx, 10*time.Second)
 	defer cancel()
 
-	client, err := mongo.Connect(ctx, options.Client().ApplyURI(cfg.URI))
+	// Size the connection pool explicitly so bursts of metadata reads and
+	// writes reuse warm connections instead of churning through new ones
+	opts := options.Client().
+		ApplyURI(cfg.URI).
+		SetMaxPoolSize(64).
+		SetMinPoolSize(4).
+		SetMaxConnIdleTime(5 * time.Minute)
+
+	client, err := mongo.Connect(ctx, opts)
 	if err != nil {
 		return nil, err
 	}
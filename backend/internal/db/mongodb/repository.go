@@ -8,6 +8,7 @@ import (
 	"go.mongodb.org/mongo-driver/bson"
 	"go.mongodb.org/mongo-driver/bson/primitive"
 	"go.mongodb.org/mongo-driver/mongo"
+	"go.mongodb.org/mongo-driver/mongo/options"
 )
 
 const (
@@ -49,6 +50,45 @@ func (c *Client) GetPackage(ctx context.Context, name string) (*models.Package,
 	return &pkg, nil
 }
 
+// GetPackagesByNames retrieves several packages in a single query
+func (c *Client) GetPackagesByNames(ctx context.Context, names []string) ([]models.Package, error) {
+	collection := c.database.Collection(packagesCollection)
+
+	cursor, err := collection.Find(ctx, bson.M{"name": bson.M{"$in": names}})
+	if err != nil {
+		return nil, err
+	}
+	defer cursor.Close(ctx)
+
+	var packages []models.Package
+	if err = cursor.All(ctx, &packages); err != nil {
+		return nil, err
+	}
+
+	return packages, nil
+}
+
+// GetPackageID resolves a package name to its ID without transferring the
+// whole document; hot paths that only need the ID should prefer this. A nil
+// error with a zero ID means the package does not exist.
+func (c *Client) GetPackageID(ctx context.Context, name string) (primitive.ObjectID, error) {
+	collection := c.database.Collection(packagesCollection)
+
+	var result struct {
+		ID primitive.ObjectID `bson:"_id"`
+	}
+	opts := options.FindOne().SetProjection(bson.M{"_id": 1})
+	err := collection.FindOne(ctx, bson.M{"name": name}, opts).Decode(&result)
+	if err != nil {
+		if err == mongo.ErrNoDocuments {
+			return primitive.NilObjectID, nil
+		}
+		return primitive.NilObjectID, err
+	}
+
+	return result.ID, nil
+}
+
 // CreatePackage creates a new package
 func (c *Client) CreatePackage(ctx context.Context, pkg *models.Package) error {
 	collection := c.database.Collection(packagesCollection)
@@ -92,6 +132,86 @@ func (c *Client) ListVersions(ctx context.Context, packageID primitive.ObjectID)
 	return versions, nil
 }
 
+// ListVersionsByPackageName retrieves all versions for a package in a single
+// round trip by resolving the package name inside the database. The second
+// return value reports whether the package exists at all.
+func (c *Client) ListVersionsByPackageName(ctx context.Context, name string) ([]models.Version, bool, error) {
+	collection := c.database.Collection(packagesCollection)
+
+	pipeline := mongo.Pipeline{
+		bson.D{{Key: "$match", Value: bson.M{"name": name}}},
+		bson.D{{Key: "$lookup", Value: bson.M{
+			"from":         versionsCollection,
+			"localField":   "_id",
+			"foreignField": "package_id",
+			"as":           "versions",
+		}}},
+		bson.D{{Key: "$project", Value: bson.M{"versions": 1}}},
+	}
+
+	cursor, err := collection.Aggregate(ctx, pipeline)
+	if err != nil {
+		return nil, false, err
+	}
+	defer cursor.Close(ctx)
+
+	var results []struct {
+		Versions []models.Version `bson:"versions"`
+	}
+	if err = cursor.All(ctx, &results); err != nil {
+		return nil, false, err
+	}
+	if len(results) == 0 {
+		return nil, false, nil
+	}
+
+	return results[0].Versions, true, nil
+}
+
+// GetVersionByPackageName retrieves one version of a package in a single
+// round trip. The second return value reports whether the package exists;
+// a nil version with found=true means the version itself is missing.
+func (c *Client) GetVersionByPackageName(ctx context.Context, name string, version string) (*models.Version, bool, error) {
+	collection := c.database.Collection(packagesCollection)
+
+	pipeline := mongo.Pipeline{
+		bson.D{{Key: "$match", Value: bson.M{"name": name}}},
+		bson.D{{Key: "$lookup", Value: bson.M{
+			"from": versionsCollection,
+			"let":  bson.M{"pkg_id": "$_id"},
+			"pipeline": mongo.Pipeline{
+				bson.D{{Key: "$match", Value: bson.M{"$expr": bson.M{"$and": bson.A{
+					bson.M{"$eq": bson.A{"$package_id", "$$pkg_id"}},
+					bson.M{"$eq": bson.A{"$version", version}},
+				}}}}},
+			},
+			"as": "versions",
+		}}},
+		bson.D{{Key: "$project", Value: bson.M{"versions": 1}}},
+	}
+
+	cursor, err := collection.Aggregate(ctx, pipeline)
+	if err != nil {
+		return nil, false, err
+	}
+	defer cursor.Close(ctx)
+
+	var results []struct {
+		Versions []models.Version `bson:"versions"`
+	}
+	if err = cursor.All(ctx, &results); err != nil {
+		return nil, false, err
+	}
+	if len(results) == 0 {
+		return nil, false, nil
+	}
+	if len(results[0].Versions) == 0 {
+		return nil, true, nil
+	}
+
+	return &results[0].Versions[0], true, nil
+}
+
 // GetVersion retrieves a specific version of a package
 func (c *Client) GetVersion(ctx context.Context, packageID primitive.ObjectID, version string) (*models.Version, error) {
 	collection := c.database.Collection(versionsCollection)
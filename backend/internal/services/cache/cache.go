@@ -0,0 +1,59 @@
+package cache
+
+import (
+	"strings"
+	"sync"
+	"time"
+)
+
+type entry struct {
+	value     interface{}
+	expiresAt time.Time
+}
+
+// Cache is a small in-process TTL cache for read-mostly responses.
+// Mutating handlers invalidate the affected keys, and the TTL bounds
+// staleness across multiple replicas.
+type Cache struct {
+	mu      sync.RWMutex
+	entries map[string]entry
+	ttl     time.Duration
+}
+
+func New(ttl time.Duration) *Cache {
+	return &Cache{
+		entries: make(map[string]entry),
+		ttl:     ttl,
+	}
+}
+
+func (c *Cache) Get(key string) (interface{}, bool) {
+	c.mu.RLock()
+	e, ok := c.entries[key]
+	c.mu.RUnlock()
+
+	if !ok || time.Now().After(e.expiresAt) {
+		return nil, false
+	}
+	return e.value, true
+}
+
+func (c *Cache) Set(key string, value interface{}) {
+	c.mu.Lock()
+	c.entries[key] = entry{
+		value:     value,
+		expiresAt: time.Now().Add(c.ttl),
+	}
+	c.mu.Unlock()
+}
+
+// InvalidatePrefix drops every entry whose key starts with prefix
+func (c *Cache) InvalidatePrefix(prefix string) {
+	c.mu.Lock()
+	for key := range c.entries {
+		if strings.HasPrefix(key, prefix) {
+			delete(c.entries, key)
+		}
+	}
+	c.mu.Unlock()
+}
@@ -2,14 +2,18 @@ package storage
 
 import (
 	"context"
+	"encoding/base64"
+	"encoding/hex"
 	"errors"
 	"fmt"
 	"io"
+	"net/http"
 	"strings"
 	"time"
 
 	"github.com/Parallels/pd-ai-agents-registry/internal/config"
 	"github.com/aws/aws-sdk-go-v2/aws"
+	awshttp "github.com/aws/aws-sdk-go-v2/aws/transport/http"
 	awsconfig "github.com/aws/aws-sdk-go-v2/config"
 	"github.com/aws/aws-sdk-go-v2/credentials"
 	"github.com/aws/aws-sdk-go-v2/service/s3"
@@ -28,6 +32,11 @@ func NewS3Service(cfg config.S3Config) (*S3Service, error) {
 	// Add region
 	options = append(options, awsconfig.WithRegion(cfg.Region))
 
+	// Bound transient-failure retries and let the adaptive mode back off
+	// under throttling instead of hammering the endpoint
+	options = append(options, awsconfig.WithRetryMaxAttempts(3))
+	options = append(options, awsconfig.WithRetryMode(aws.RetryModeAdaptive))
+
 	// Add credentials
 	options = append(options, awsconfig.WithCredentialsProvider(
 		credentials.NewStaticCredentialsProvider(
@@ -37,6 +46,17 @@ func NewS3Service(cfg config.S3Config) (*S3Service, error) {
 		),
 	))
 
+	// Use a shared HTTP client with generous keep-alive settings so repeated
+	// S3 calls (uploads, head checks, presigning) reuse pooled TCP+TLS
+	// connections instead of paying a handshake per request
+	options = append(options, awsconfig.WithHTTPClient(
+		awshttp.NewBuildableClient().WithTransportOptions(func(tr *http.Transport) {
+			tr.MaxIdleConns = 64
+			tr.MaxIdleConnsPerHost = 32
+			tr.IdleConnTimeout = 90 * time.Second
+		}),
+	))
+
 	// Load the config with all options
 	awsCfg, err := awsconfig.LoadDefaultConfig(context.TODO(), options...)
 	if err != nil {
@@ -78,7 +98,7 @@ func NewS3Service(cfg config.S3Config) (*S3Service, error) {
 	}, nil
 }
 
-func (s *S3Service) Upload(ctx context.Context, key string, reader io.Reader) error {
+func (s *S3Service) Upload(ctx context.Context, key string, reader io.Reader, size int64) error {
 	input := &s3.PutObjectInput{
 		Bucket:       aws.String(s.bucket),
 		Key:          aws.String(key),
@@ -86,6 +106,11 @@ func (s *S3Service) Upload(ctx context.Context, key string, reader io.Reader) er
 		ContentType:  aws.String("application/octet-stream"),
 		StorageClass: types.StorageClassStandard,
 	}
+	// Callers know the upload size up front; declaring it saves the SDK
+	// from seeking through the body to discover the content length
+	if size > 0 {
+		input.ContentLength = aws.Int64(size)
+	}
 
 	_, err := s.client.PutObject(ctx, input)
 	if err != nil {
@@ -98,6 +123,38 @@ func (s *S3Service) Upload(ctx context.Context, key string, reader io.Reader) er
 	return nil
 }
 
+// UploadWithChecksum uploads an object and has S3 verify its SHA-256 digest
+// during the transfer, so callers that already know the hash do not need a
+// separate hashing pass over the bytes
+func (s *S3Service) UploadWithChecksum(ctx context.Context, key string, reader io.Reader, size int64, sha256Hex string) error {
+	sum, err := hex.DecodeString(sha256Hex)
+	if err != nil || len(sum) != 32 {
+		return fmt.Errorf("invalid sha256 checksum: %q", sha256Hex)
+	}
+
+	input := &s3.PutObjectInput{
+		Bucket:         aws.String(s.bucket),
+		Key:            aws.String(key),
+		Body:           reader,
+		ContentType:    aws.String("application/octet-stream"),
+		StorageClass:   types.StorageClassStandard,
+		ChecksumSHA256: aws.String(base64.StdEncoding.EncodeToString(sum)),
+	}
+	if size > 0 {
+		input.ContentLength = aws.Int64(size)
+	}
+
+	_, err = s.client.PutObject(ctx, input)
+	if err != nil {
+		var apiErr smithy.APIError
+		if errors.As(err, &apiErr) {
+			return fmt.Errorf("s3 upload failed: %s: %s", apiErr.ErrorCode(), apiErr.ErrorMessage())
+		}
+		return fmt.Errorf("s3 upload failed: %w", err)
+	}
+	return nil
+}
+
 func (s *S3Service) Download(ctx context.Context, key string) (io.ReadCloser, error) {
 	input := &s3.GetObjectInput{
 		Bucket: aws.String(s.bucket),
@@ -139,6 +196,8 @@ func (s *S3Service) Delete(ctx context.Context, key string) error {
 		Key:    aws.String(key),
 	}
 
+	// DeleteObject is atomic on the server side; there is no need to poll
+	// with a waiter afterwards, which used to block the caller for up to 30s
 	_, err := s.client.DeleteObject(ctx, input)
 	if err != nil {
 		var apiErr smithy.APIError
@@ -148,25 +207,43 @@ func (s *S3Service) Delete(ctx context.Context, key string) error {
 		return fmt.Errorf("s3 delete failed: %w", err)
 	}
 
-	// Wait until the object is deleted
-	waiter := s3.NewObjectNotExistsWaiter(s.client)
-	err = waiter.Wait(ctx, &s3.HeadObjectInput{
+	return nil
+}
+
+func (s *S3Service) GetSignedURL(ctx context.Context, key string, duration time.Duration) (string, error) {
+	presignClient := s3.NewPresignClient(s.client)
+
+	input := &s3.GetObjectInput{
 		Bucket: aws.String(s.bucket),
 		Key:    aws.String(key),
-	}, 30*time.Second)
+	}
+
+	request, err := presignClient.PresignGetObject(ctx, input, func(options *s3.PresignOptions) {
+		options.Expires = duration
+	})
 	if err != nil {
-		return fmt.Errorf("error waiting for object deletion: %w", err)
+		var apiErr smithy.APIError
+		if errors.As(err, &apiErr) {
+			return "", fmt.Errorf("failed to generate presigned URL: %s: %s", apiErr.ErrorCode(), apiErr.ErrorMessage())
+		}
+		return "", fmt.Errorf("failed to generate presigned URL: %w", err)
 	}
 
-	return nil
+	return request.URL, nil
 }
 
-func (s *S3Service) GetSignedURL(ctx context.Context, key string, duration time.Duration) (string, error) {
+// GetSignedDownloadURL presigns a GetObject request that overrides the
+// response Content-Type and Content-Disposition headers, so objects stored
+// with a generic content type are still served to clients as downloads of
+// the right type
+func (s *S3Service) GetSignedDownloadURL(ctx context.Context, key string, duration time.Duration, contentType, filename string) (string, error) {
 	presignClient := s3.NewPresignClient(s.client)
 
 	input := &s3.GetObjectInput{
-		Bucket: aws.String(s.bucket),
-		Key:    aws.String(key),
+		Bucket:                     aws.String(s.bucket),
+		Key:                        aws.String(key),
+		ResponseContentType:        aws.String(contentType),
+		ResponseContentDisposition: aws.String(`attachment; filename="` + filename + `"`),
 	}
 
 	request, err := presignClient.PresignGetObject(ctx, input, func(options *s3.PresignOptions) {